@@ -1,14 +1,66 @@
 from getpass import getpass # XXX: Maybe this too
-import toml
+import tomllib
+import tomli_w
 import datetime
+import os
+import functools
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from zoneinfo import ZoneInfo
 
 from faff_core.models import Plan, Log, Timesheet, TimesheetMeta
 from faff_core.plugins import PlanSource, Audience
 
+# Log inserts/deletes are independent round-trips, so fan them out
+MAX_CONCURRENT_REQUESTS = 8
+
+UTC = ZoneInfo("UTC")
+
+def _utc_now() -> datetime.datetime:
+    return datetime.datetime.now(UTC)
+
 class MyHoursPlugin(PlanSource, Audience):
 
+    # Last auth dict loaded from or written to token.toml
+    _auth_cache = None
+    # Authorization header for _auth_cache's access token
+    _auth_headers = None
+    # Last projects.cache.json contents: validators plus the parsed trackers
+    _projects_cache = None
+
+    @property
+    def _auth_lock(self) -> threading.Lock:
+        # Serialises token loads/refreshes so concurrent workers share one
+        # refresh. Per instance, so one audience's login prompt doesn't block
+        # another's requests; setdefault is atomic, so even racing first
+        # callers end up with the same lock.
+        return self.__dict__.setdefault('_auth_lock_instance', threading.Lock())
+
+    @functools.cached_property
+    def _session(self) -> requests.Session:
+        # One pooled session per plugin instance, so consecutive calls to
+        # api2.myhours.com reuse the same keep-alive TLS connection.
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        return session
+
+    @functools.cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        # Shared across submits so a multi-day push reuses the same worker
+        # threads (and their pooled connections) rather than spinning up a
+        # fresh pool for every delete/insert phase.
+        return ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS,
+            thread_name_prefix="myhours"
+        )
+
+    def _fanout(self, fn, items) -> list:
+        # list() drains the iterator so the first worker exception is raised here
+        return list(self._executor.map(fn, items))
+
     def initialise_auth(self):
         # FIXME: Should this be using typer?
         print("Please enter your password to authenticate with MyHours.")
@@ -24,27 +76,47 @@ class MyHoursPlugin(PlanSource, Audience):
             "clientId": "api"
         }
 
-        data = requests.post(LOGIN_API, json=body)
+        data = self._session.post(LOGIN_API, json=body)
         if data.status_code == 200:
-            expires_at_dt = datetime.datetime.now(ZoneInfo("UTC")) + datetime.timedelta(seconds=data.json().get('expiresIn'))
-            auth = {
-                "access_token": data.json().get('accessToken'),
-                "refresh_token": data.json().get('refreshToken'),
-                "expires_in": data.json().get('expiresIn'),
-                "expires_at": expires_at_dt
-            }
-            # Write to file with isoformat string
-            auth_to_save = auth.copy()
-            auth_to_save["expires_at"] = expires_at_dt.isoformat()
-            (self.state_path / 'token.toml').write_text(toml.dumps(auth_to_save))
-            return auth
+            return self._save_auth(orjson.loads(data.content))
         elif data.status_code == 401:
             raise ValueError("Invalid credentials. Please check your email and password.")
         else:
             raise ValueError("An error occurred during authentication.")
 
+    def _save_auth(self, payload: dict) -> dict:
+        """
+        Builds the auth dict from a login/refresh response and persists it.
+
+        Args:
+            payload (Dict[str, Any]): The decoded token response body.
+        """
+        expires_in = payload.get('expiresIn')
+        expires_at_dt = _utc_now() + datetime.timedelta(seconds=expires_in)
+        auth = {
+            "access_token": payload.get('accessToken'),
+            "refresh_token": payload.get('refreshToken'),
+            "expires_in": expires_in,
+            "expires_at": expires_at_dt
+        }
+        # Write to file with isoformat string
+        auth_to_save = auth.copy()
+        auth_to_save["expires_at"] = expires_at_dt.isoformat()
+        self._write_state('token.toml', tomli_w.dumps(auth_to_save).encode())
+        return auth
+
+    def _write_state(self, name: str, data: bytes) -> None:
+        """
+        Atomically replaces a file in the state directory, so a crash mid-write
+        can't leave a truncated token or cache behind.
+        """
+        path = self.state_path / name
+        tmp_path = path.with_name(f"{name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
     def refresh_if_necessary(self, auth):
-        if datetime.datetime.now(ZoneInfo("UTC")) > auth['expires_at'] - datetime.timedelta(minutes=5):
+        if _utc_now() > auth['expires_at'] - datetime.timedelta(minutes=5):
             print("Refreshing MyHours token...")
             REFRESH_API = "https://api2.myhours.com/api/tokens/refresh"
             body = {
@@ -54,20 +126,9 @@ class MyHoursPlugin(PlanSource, Audience):
 
             headers = {"Authorization": f"Bearer { auth['access_token'] }"}
 
-            refresh = requests.post(REFRESH_API, json=body, headers=headers)
+            refresh = self._session.post(REFRESH_API, json=body, headers=headers)
             if refresh.status_code == 200:
-                expires_at_dt = datetime.datetime.now(ZoneInfo("UTC")) + datetime.timedelta(seconds=refresh.json().get('expiresIn'))
-                new_auth = {
-                    "access_token": refresh.json().get('accessToken'),
-                    "refresh_token": refresh.json().get('refreshToken'),
-                    "expires_in": refresh.json().get('expiresIn'),
-                    "expires_at": expires_at_dt
-                }
-                # Write to file with isoformat string
-                new_auth_to_save = new_auth.copy()
-                new_auth_to_save["expires_at"] = expires_at_dt.isoformat()
-                (self.state_path / 'token.toml').write_text(toml.dumps(new_auth_to_save))
-                return new_auth
+                return self._save_auth(orjson.loads(refresh.content))
             elif refresh.status_code == 401:
                 (self.state_path / 'token.toml').unlink(missing_ok=True)
                 raise ValueError("Invalid refresh token. You will have to re-authenticate.")
@@ -83,18 +144,34 @@ class MyHoursPlugin(PlanSource, Audience):
         This method is a placeholder and should be implemented based on the
         specific authentication requirements of the MyHours API.
         """
-        token_state_path = self.state_path / 'token.toml'
-        try:
-            loaded_toml = toml.loads(token_state_path.read_text())
-            auth = {
-                "access_token": loaded_toml.get('access_token'),
-                "refresh_token": loaded_toml.get('refresh_token'),
-                "expires_in": loaded_toml.get('expires_in'),
-                "expires_at": datetime.datetime.fromisoformat(loaded_toml.get('expires_at', ''))
-            }
+        if self._auth_is_fresh(self._auth_cache):
+            return self._auth_cache.get('access_token')
+
+        with self._auth_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._auth_is_fresh(self._auth_cache):
+                return self._auth_cache.get('access_token')
+            return self._load_or_refresh_auth()
+
+    @staticmethod
+    def _auth_is_fresh(auth) -> bool:
+        return bool(auth) and auth['expires_at'] - _utc_now() > datetime.timedelta(minutes=5)
+
+    def _load_or_refresh_auth(self):
+        auth = self._auth_cache
+        if auth is None:
+            token_state_path = self.state_path / 'token.toml'
+            try:
+                loaded_toml = tomllib.loads(token_state_path.read_text())
+                auth = {
+                    "access_token": loaded_toml.get('access_token'),
+                    "refresh_token": loaded_toml.get('refresh_token'),
+                    "expires_in": loaded_toml.get('expires_in'),
+                    "expires_at": datetime.datetime.fromisoformat(loaded_toml.get('expires_at', ''))
+                }
 
-        except FileNotFoundError:
-            auth = self.initialise_auth()
+            except FileNotFoundError:
+                auth = self.initialise_auth()
 
         try:
             auth = self.refresh_if_necessary(auth)
@@ -106,36 +183,76 @@ class MyHoursPlugin(PlanSource, Audience):
             else:
                 raise
 
-        return auth.get('access_token')
+        self._auth_cache = auth
+        access_token = auth.get('access_token')
+        self._auth_headers = {"Authorization": f"Bearer {access_token}"}
+        return access_token
+
+    def _headers(self) -> dict:
+        """
+        Returns the Authorization header for the current token, authenticating
+        first if needed. Entry points call this once up front; the requests
+        they then make just use the current header.
+        """
+        self.authenticate()
+        return self._auth_headers
+
+    def _authed_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request on the shared session with the current Authorization
+        header. If MyHours rejects the token with a 401 (e.g. clock skew ran it
+        out early), the token is refreshed and the request retried once.
+        """
+        auth_headers = self._auth_headers
+        if auth_headers is None:
+            auth_headers = self._headers()
+        extra_headers = kwargs.pop('headers', {})
+
+        response = self._session.request(method, url, headers={**auth_headers, **extra_headers}, **kwargs)
+
+        if response.status_code == 401:
+            with self._auth_lock:
+                # Only the first worker to see this token rejected forces a refresh
+                if self._auth_headers is auth_headers:
+                    print("Session expired. Re-authenticating...")
+                    # Mark the token expired so authenticate() goes through
+                    # refresh_if_necessary, falling back to a login if the
+                    # refresh token has been rejected too
+                    self._auth_cache = {**self._auth_cache, "expires_at": _utc_now()}
+            auth_headers = self._headers()
+            response = self._session.request(method, url, headers={**auth_headers, **extra_headers}, **kwargs)
+
+        return response
 
     def pull_plan(self, date: datetime.date) -> Plan:
-        myhours_bearer_token = self.authenticate()
-        headers = {"Authorization": f"Bearer {myhours_bearer_token}"}
+        self._headers()
 
         print("Pulling MyHours plan...")
 
-        # Pagination setup
-        trackers = {}
-        resp = requests.get(
-            "https://api2.myhours.com/api/projects",
-            headers=headers
-        )
+        # Projects rarely change, so revalidate the cached list rather than
+        # downloading it again
+        cache = self._load_projects_cache()
+        headers = {}
+        if 'trackers' in cache:
+            if cache.get('etag'):
+                headers["If-None-Match"] = cache['etag']
+            if cache.get('last_modified'):
+                headers["If-Modified-Since"] = cache['last_modified']
 
-        # Handle 401 by re-authenticating
-        if resp.status_code == 401:
-            print("Session expired. Re-authenticating...")
-            (self.state_path / 'token.toml').unlink(missing_ok=True)
-            myhours_bearer_token = self.authenticate()
-            headers = {"Authorization": f"Bearer {myhours_bearer_token}"}
-            resp = requests.get(
-                "https://api2.myhours.com/api/projects",
-                headers=headers
-            )
+        resp = self._authed_request("GET", "https://api2.myhours.com/api/projects", headers=headers)
 
-        resp.raise_for_status()
-        page_data = resp.json()
-        for project in page_data:
-            trackers[str(project.get('id'))] = project.get('name')
+        if resp.status_code == 304 and headers:
+            trackers = cache['trackers']
+        else:
+            resp.raise_for_status()
+            trackers = {}
+            page_data = orjson.loads(resp.content)
+            for project in page_data:
+                # Archived projects reject new logs, so don't offer them as trackers
+                if project.get('archived'):
+                    continue
+                trackers[str(project.get('id'))] = project.get('name')
+            self._save_projects_cache(resp, trackers)
 
         return Plan(
             source=self.id,
@@ -148,15 +265,36 @@ class MyHoursPlugin(PlanSource, Audience):
             trackers=trackers
         )
 
+    def _load_projects_cache(self) -> dict:
+        if self._projects_cache is None:
+            try:
+                self._projects_cache = orjson.loads((self.state_path / 'projects.cache.json').read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                self._projects_cache = {}
+        return self._projects_cache
+
+    def _save_projects_cache(self, resp: requests.Response, trackers: dict) -> None:
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            # Nothing to revalidate against next time
+            return
+
+        self._projects_cache = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "trackers": trackers
+        }
+        self._write_state('projects.cache.json', orjson.dumps(self._projects_cache))
+
     def compile_time_sheet(self, log: Log) -> Timesheet:
         # Only include sessions that have trackers from this plugin's source
         # e.g., if self.id is "element", only include sessions with trackers starting with "element:"
-        def has_tracker_for_this_source(session):
-            if not session.intent.trackers:
-                return False
-            return any(t.startswith(f'{self.id}:') for t in session.intent.trackers)
-
-        timeline = [x for x in log.timeline if has_tracker_for_this_source(x)]
+        prefix = f'{self.id}:'
+        timeline = [
+            x for x in log.timeline
+            if x.intent.trackers and any(t.startswith(prefix) for t in x.intent.trackers)
+        ]
 
         # Always create a timesheet, even if empty
         # This allows the system to track that this date has been compiled
@@ -164,7 +302,7 @@ class MyHoursPlugin(PlanSource, Audience):
             actor=self.config.get('actor', ''),
             signatures={},
             date=log.date,
-            compiled=datetime.datetime.now(ZoneInfo("UTC")),
+            compiled=_utc_now(),
             timezone=log.timezone,
             timeline=timeline,
             meta=TimesheetMeta(
@@ -174,39 +312,95 @@ class MyHoursPlugin(PlanSource, Audience):
         )
 
     def get_myhours_day(self, date: datetime.date) -> dict:
-        myhours_bearer_token = self.authenticate()
-        headers = {"Authorization": f"Bearer {myhours_bearer_token}"}
-
-        response = requests.get(
+        response = self._authed_request(
+            "GET",
             "https://api2.myhours.com/api/Logs",
-            headers=headers,
             params={
                 "date": date.isoformat(),  # FIXME: This feels vulnerable to timezone issues
                 "step": "100"
             }
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def check_day_empty(self, date: datetime.date) -> bool:
+        self._headers()
         myhours_day = self.get_myhours_day(date)
         return myhours_day == []
     
     def vape_myhours_day(self, date: datetime.date) -> None:
+        self._headers()
         day = self.get_myhours_day(date)
         if not day:
             print(f"No existing MyHours entries for {date}")
             return
 
         print(f"Found {len(day)} existing MyHours entry/entries for {date}:")
-        for mh_log in day:
+        self._delete_myhours_logs(day)
+
+    def _delete_myhours_logs(self, logs: list) -> None:
+        for mh_log in logs:
             log_id = mh_log.get('id')
             project = mh_log.get('projectName', 'Unknown project')
             note = mh_log.get('note', 'No note')
             duration = mh_log.get('duration', 0)
             hours = duration / 3600 if duration else 0
             print(f"  Deleting: [{project}] {note} ({hours:.2f}h) [ID: {log_id}]")
-            self.delete_myhours_log(log_id)
+
+        self._fanout(self.delete_myhours_log, [m.get('id') for m in logs])
+
+    @staticmethod
+    def _log_key(mh_log: dict):
+        """
+        Identity of a MyHours log (existing or about to be inserted) for
+        diffing a day against a timesheet. Returns None when the times can't
+        be read unambiguously, in which case the log is always replaced.
+        """
+        start, end = mh_log.get('start'), mh_log.get('end')
+        times = mh_log.get('times') or []
+        if start is None and len(times) == 1:
+            start, end = times[0].get('startTime'), times[0].get('endTime')
+
+        try:
+            start_dt = datetime.datetime.fromisoformat(start)
+            end_dt = datetime.datetime.fromisoformat(end)
+        except (TypeError, ValueError):
+            return None
+        # Naive times could be in any zone, so don't guess
+        if start_dt.tzinfo is None or end_dt.tzinfo is None:
+            return None
+
+        return (str(mh_log.get('projectId')), mh_log.get('note'), start_dt, end_dt)
+
+    def _diff_myhours_day(self, day: list, entries: list) -> tuple:
+        """
+        Matches a day's existing MyHours logs against the entries about to be
+        submitted, so that identical logs are neither deleted nor re-inserted.
+
+        Args:
+            day (List[Dict[str, Any]]): Existing logs from get_myhours_day.
+            entries (List[Tuple[Dict[str, Any], float]]): (log, hours) pairs to submit.
+
+        Returns:
+            The existing logs to delete and the entries still to insert.
+        """
+        unmatched = {}
+        for mh_log in day:
+            key = self._log_key(mh_log)
+            if key is not None:
+                unmatched.setdefault(key, []).append(mh_log)
+
+        kept_ids = set()
+        to_insert = []
+        for entry in entries:
+            matches = unmatched.get(self._log_key(entry[0]))
+            if matches:
+                kept_ids.add(matches.pop().get('id'))
+            else:
+                to_insert.append(entry)
+
+        stale = [m for m in day if m.get('id') not in kept_ids]
+        return stale, to_insert
 
     def insert_myhours_log(self, thing) -> None:
         """
@@ -215,13 +409,11 @@ class MyHoursPlugin(PlanSource, Audience):
         Args:
             thing (Dict[str, Any]): The log entry to insert.
         """
-        myhours_bearer_token = self.authenticate()
-        headers = {"Authorization": f"Bearer {myhours_bearer_token}"}
-
-        response = requests.post(
+        response = self._authed_request(
+            "POST",
             "https://api2.myhours.com/api/Logs/insertlog",
-            json=thing,
-            headers=headers
+            data=orjson.dumps(thing),
+            headers={"Content-Type": "application/json"}
         )
 
         if response.status_code >= 400:
@@ -232,7 +424,7 @@ class MyHoursPlugin(PlanSource, Audience):
             # Check for specific error cases
             if response.status_code == 400:
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     # Check both message and validationErrors array for archived project error
                     validation_errors = error_data.get("validationErrors", [])
                     error_text = error_data.get("message", "").lower()
@@ -259,12 +451,9 @@ class MyHoursPlugin(PlanSource, Audience):
         Args:
             log_id (int): The ID of the log entry to delete.
         """
-        myhours_bearer_token = self.authenticate()
-        headers = {"Authorization": f"Bearer {myhours_bearer_token}"}
-
-        response = requests.delete(
-            f"https://api2.myhours.com/api/Logs/{myhours_log_id}",
-            headers=headers
+        response = self._authed_request(
+            "DELETE",
+            f"https://api2.myhours.com/api/Logs/{myhours_log_id}"
         )
         response.raise_for_status()
 
@@ -282,34 +471,49 @@ class MyHoursPlugin(PlanSource, Audience):
             return
 
         print(f"\nSubmitting timesheet for {timesheet.date}...")
-        self.vape_myhours_day(timesheet.date)
-
-        print(f"\nInserting {len(timesheet.timeline)} entry/entries:")
+        entries = []
         for item in timesheet.timeline:
             # Validate trackers exist and are not empty
             if not item.intent.trackers or len(item.intent.trackers) == 0:
                 print(f"Warning: Skipping timeline item '{item.intent.alias}' - no trackers found")
                 continue
 
-            # Extract tracker ID, handling the 'element:' prefix if present
-            tracker_raw = item.intent.trackers[0]
-            if tracker_raw.startswith('element:'):
-                tracker = tracker_raw[len('element:'):]
-            else:
-                # If no prefix, use as-is (for backwards compatibility or other tracker formats)
-                tracker = tracker_raw
+            # Extract tracker ID, handling the 'element:' prefix if present.
+            # If no prefix, use as-is (for backwards compatibility or other tracker formats)
+            tracker = item.intent.trackers[0].removeprefix('element:')
 
             # Calculate duration for display
-            duration_seconds = (item.end - item.start).total_seconds()
-            hours = duration_seconds / 3600
+            hours = (item.end - item.start).total_seconds() / 3600
 
+            # MyHours files the entry under the local calendar date, but wants
+            # the times themselves in UTC
             myhours_log = {
                 "projectId": tracker,
                 "note": f"{item.intent.alias}",
-                "date": item.start.strftime("%Y-%m-%d"),
-                "start": item.start.astimezone(ZoneInfo("UTC")).isoformat(),
-                "end": item.end.astimezone(ZoneInfo("UTC")).isoformat(),
+                "date": item.start.date().isoformat(),
+                "start": item.start.astimezone(UTC).isoformat(),
+                "end": item.end.astimezone(UTC).isoformat(),
             }
 
-            print(f"  Inserting: [Project {tracker}] {item.intent.alias} ({hours:.2f}h)")
-            self.insert_myhours_log(myhours_log)
\ No newline at end of file
+            entries.append((myhours_log, hours))
+
+        # Authenticate once up front; the workers reuse the current header
+        self._headers()
+
+        # Only touch MyHours logs that actually differ from the timesheet
+        day = self.get_myhours_day(timesheet.date)
+        stale, entries = self._diff_myhours_day(day, entries)
+
+        unchanged = len(day) - len(stale)
+        if unchanged:
+            print(f"Keeping {unchanged} MyHours entry/entries that already match")
+        if stale:
+            print(f"Found {len(stale)} outdated MyHours entry/entries for {timesheet.date}:")
+            self._delete_myhours_logs(stale)
+
+        print(f"\nInserting {len(entries)} entry/entries:")
+        for myhours_log, hours in entries:
+            print(f"  Inserting: [Project {myhours_log['projectId']}] {myhours_log['note']} ({hours:.2f}h)")
+
+        self._fanout(self.insert_myhours_log, [myhours_log for myhours_log, _ in entries])
+